@@ -8,6 +8,7 @@ from typing import Literal
 
 from google.adk.agents import Agent
 from google.adk.events import Event
+from google.adk.models.llm_request import LlmRequest
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
@@ -26,6 +27,58 @@ class AdkTranslateConfig:
     provider: Literal["gemini", "openai", "anthropic", "github", "copilot-sdk"] | None = None
     app_name: str = "adk_md_translator"
     user_id: str = "translator"
+    target_lang: str = "es"
+
+
+# Nombres (en español, como el resto del prompt) de los idiomas destino conocidos.
+# Códigos desconocidos se pasan tal cual al modelo.
+_LANGUAGE_NAMES = {
+    "es": "español",
+    "pt": "portugués",
+    "fr": "francés",
+    "de": "alemán",
+    "it": "italiano",
+    "ja": "japonés",
+    "ko": "coreano",
+    "zh": "chino",
+}
+
+
+def language_name(code: str) -> str:
+    return _LANGUAGE_NAMES.get(code.lower().split("-")[0], code)
+
+
+def _build_instruction(target_lang: str) -> str:
+    name = language_name(target_lang)
+    return (
+        f"Eres un traductor profesional de documentación técnica EN→{target_lang.upper()}.\n\n"
+        "REGLAS ESTRICTAS:\n"
+        f"1. Traduce TODO el texto al {name} (títulos, párrafos, listas)\n"
+        "2. Traduce COMENTARIOS dentro del código (#, //, /* */)\n"
+        "3. PRESERVA EXACTAMENTE sin cambios:\n"
+        "   - Bloques de código (```python, ```javascript, etc.) EXCEPTO comentarios\n"
+        "   - Código inline entre backticks `como esto`\n"
+        "   - URLs y links [texto](url)\n"
+        "   - HTML tags y atributos\n"
+        "   - Frontmatter YAML (---)\n"
+        "   - Nombres de variables, funciones, clases, imports\n"
+        "   - Paths, comandos, strings de código\n"
+        "   - Marcadores de la forma <<ADK_P0>>, <<ADK_P1>>, ... (cópialos tal cual)\n"
+        "4. Mantén el formato Markdown idéntico\n"
+        "5. Tu respuesta debe empezar INMEDIATAMENTE con el contenido traducido\n"
+        "6. NO escribas: 'Aquí está', 'Traducción completada', ni ningún texto adicional\n"
+        "7. NO agregues líneas con '---' al inicio o final\n"
+        "8. La primera línea de tu respuesta DEBE ser la primera línea del documento traducido\n"
+        "9. Si el mensaje trae un bloque 'GLOSARIO', usa EXACTAMENTE esas traducciones para esos "
+        "términos ('no traducir' = déjalo igual) y NO incluyas el bloque en tu respuesta"
+    )
+
+
+def _user_parts(text: str, glossary: str | None) -> list[types.Part]:
+    # El glosario viaja como parte aparte del mensaje, antes del documento.
+    if glossary:
+        return [types.Part(text=glossary), types.Part(text=text)]
+    return [types.Part(text=text)]
 
 
 class AdkTranslator:
@@ -38,26 +91,11 @@ class AdkTranslator:
         self._agent = Agent(
             name="md_translator",
             model=model_config,
-            description="Traduce Markdown del inglés al español preservando código.",
-            instruction=(
-                "Eres un traductor profesional de documentación técnica EN→ES.\n\n"
-                "REGLAS ESTRICTAS:\n"
-                "1. Traduce TODO el texto en español (títulos, párrafos, listas)\n"
-                "2. Traduce COMENTARIOS dentro del código (#, //, /* */)\n"
-                "3. PRESERVA EXACTAMENTE sin cambios:\n"
-                "   - Bloques de código (```python, ```javascript, etc.) EXCEPTO comentarios\n"
-                "   - Código inline entre backticks `como esto`\n"
-                "   - URLs y links [texto](url)\n"
-                "   - HTML tags y atributos\n"
-                "   - Frontmatter YAML (---)\n"
-                "   - Nombres de variables, funciones, clases, imports\n"
-                "   - Paths, comandos, strings de código\n"
-                "4. Mantén el formato Markdown idéntico\n"
-                "5. Tu respuesta debe empezar INMEDIATAMENTE con el contenido traducido\n"
-                "6. NO escribas: 'Aquí está', 'Traducción completada', ni ningún texto adicional\n"
-                "7. NO agregues líneas con '---' al inicio o final\n"
-                "8. La primera línea de tu respuesta DEBE ser la primera línea del documento traducido"
+            description=(
+                f"Traduce Markdown del inglés al {language_name(self._config.target_lang)} "
+                "preservando código."
             ),
+            instruction=_build_instruction(self._config.target_lang),
             tools=[],
         )
 
@@ -105,7 +143,7 @@ class AdkTranslator:
                     "Falta GOOGLE_API_KEY en el entorno. Configúrala para usar Gemini."
                 )
 
-    async def translate_text(self, text: str) -> str:
+    async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
         self._ensure_api_key()
 
         session_service = InMemorySessionService()
@@ -141,7 +179,7 @@ class AdkTranslator:
                     ),
                 )
 
-        content = types.Content(role="user", parts=[types.Part(text=text)])
+        content = types.Content(role="user", parts=_user_parts(text, glossary))
 
         final_text = None
         async for event in runner.run_async(
@@ -156,3 +194,43 @@ class AdkTranslator:
             raise RuntimeError("El agente no devolvió respuesta final.")
 
         return final_text
+
+
+class DirectAdkTranslator(AdkTranslator):
+    """Llama directo al `BaseLlm` del agente, sin Runner ni sesiones.
+
+    Usa el mismo modelo (Gemini, LiteLlm o CopilotModel) e instrucción que
+    `AdkTranslator`, pero arma el `LlmRequest` a mano: una traducción es un
+    request stateless, así que no hace falta crear sesión ni recorrer eventos.
+    """
+
+    def __init__(self, config: AdkTranslateConfig | None = None):
+        super().__init__(config)
+        self._llm = self._agent.canonical_model
+        self._generate_config = types.GenerateContentConfig(
+            system_instruction=self._agent.instruction,
+        )
+
+    async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+        self._ensure_api_key()
+
+        request = LlmRequest(
+            model=self._llm.model,
+            contents=[types.Content(role="user", parts=_user_parts(text, glossary))],
+            config=self._generate_config.model_copy(),
+        )
+
+        chunks: list[str] = []
+        async for response in self._llm.generate_content_async(request, stream=False):
+            if response.error_code:
+                raise RuntimeError(
+                    f"El modelo devolvió error {response.error_code}: {response.error_message}"
+                )
+            if response.partial or not (response.content and response.content.parts):
+                continue
+            chunks.extend(p.text for p in response.content.parts if p.text and not p.thought)
+
+        if not chunks:
+            raise RuntimeError("El modelo no devolvió respuesta final.")
+
+        return "".join(chunks)
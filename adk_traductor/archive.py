@@ -0,0 +1,138 @@
+"""Lectura y escritura de archivos comprimidos (tar, tar.gz, zip) en streaming.
+
+Los miembros se leen en orden, sin extraerlos a disco; el archivo de salida se
+escribe incrementalmente sobre un temporal que se renombra al cerrar.
+"""
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import IO, Callable, Iterator, Literal
+
+
+ArchiveFormat = Literal["zip", "tar", "tar.gz"]
+
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+
+
+def archive_format(path: Path) -> ArchiveFormat:
+    name = path.name.lower()
+    if name.endswith(".zip"):
+        return "zip"
+    if name.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if name.endswith(".tar"):
+        return "tar"
+    raise ValueError(f"Formato de archivo no soportado (use .zip, .tar, .tar.gz o .tgz): {path}")
+
+
+def is_markdown(name: str) -> bool:
+    return name.lower().endswith(MARKDOWN_SUFFIXES)
+
+
+def member_path(name: str) -> PurePosixPath:
+    """Ruta relativa normalizada de un miembro.
+
+    ValueError si es absoluta, tiene una unidad de Windows o sube con `..`: escribirla
+    bajo el destino podría escapar de él (zip-slip).
+    """
+    path = PurePosixPath(name.replace("\\", "/"))
+    if path.is_absolute() or PureWindowsPath(name).drive or ".." in path.parts or not path.parts:
+        raise ValueError(f"Ruta de miembro insegura: {name!r}")
+    return path
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    name: str
+    size: int
+    mtime: float
+    open: Callable[[], IO[bytes]]  # válido solo hasta pasar al siguiente miembro
+
+
+def iter_members(path: Path) -> Iterator[ArchiveMember]:
+    """Recorre los archivos regulares de `path` en orden (directorios y links se omiten)."""
+    if archive_format(path) == "zip":
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                yield ArchiveMember(
+                    name=info.filename,
+                    size=info.file_size,
+                    mtime=time.mktime(info.date_time + (0, 0, -1)),
+                    open=lambda info=info: zf.open(info),
+                )
+        return
+
+    # "r|*": modo stream, lectura secuencial sin seeks (sirve también para .tar.gz).
+    with tarfile.open(path, "r|*") as tf:
+        for info in tf:
+            if not info.isfile():
+                continue
+            yield ArchiveMember(
+                name=info.name,
+                size=info.size,
+                mtime=info.mtime,
+                open=lambda info=info: tf.extractfile(info),
+            )
+
+
+class ArchiveWriter:
+    def __init__(self, path: Path):
+        self.path = path
+        self._format = archive_format(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        os.close(fd)
+        self._tmp = Path(tmp)
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        if self._format == "zip":
+            self._zip = zipfile.ZipFile(self._tmp, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._tar = tarfile.open(self._tmp, "w:gz" if self._format == "tar.gz" else "w")
+
+    def add_text(self, name: str, text: str) -> None:
+        data = text.encode("utf-8")
+        self.add_stream(name, io.BytesIO(data), len(data), time.time())
+
+    def add_stream(self, name: str, src: IO[bytes], size: int, mtime: float) -> None:
+        """Copia `size` bytes de `src` como miembro `name`, sin decodificarlos."""
+        if self._zip is not None:
+            # ZIP no representa fechas anteriores a 1980.
+            info = zipfile.ZipInfo(name, date_time=max(time.localtime(mtime)[:6], (1980, 1, 1, 0, 0, 0)))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with self._zip.open(info, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as dst:
+                shutil.copyfileobj(src, dst)
+            return
+        assert self._tar is not None
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(mtime)
+        info.mode = 0o644
+        self._tar.addfile(info, src)
+
+    def close(self, *, commit: bool = True) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if commit:
+            os.replace(self._tmp, self.path)
+        else:
+            self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        # Si la corrida falla, no se deja un archivo de salida a medio escribir.
+        self.close(commit=exc_type is None)
@@ -4,7 +4,29 @@ import argparse
 import asyncio
 from pathlib import Path
 
-from .pipeline import TranslateOptions, translate_file, translate_many
+from .pipeline import (
+    TranslateOptions,
+    plan_archive,
+    plan_batch,
+    translate_archive,
+    translate_file,
+    translate_many,
+)
+from .io_stage import DEFAULT_IO_WORKERS, LoopLag
+from .planner import DEFAULT_MAX_CHUNK_TOKENS
+
+
+def _parse_langs(value: str) -> tuple[str, ...]:
+    langs = tuple(dict.fromkeys(x.strip() for x in value.split(",") if x.strip()))
+    if not langs:
+        raise argparse.ArgumentTypeError("Debe indicar al menos un idioma (ej: es,pt,fr)")
+    return langs
+
+
+def _fmt_seconds(seconds: float) -> str:
+    m, s = divmod(round(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h}h {m:02d}m {s:02d}s" if h else f"{m}m {s:02d}s"
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -21,16 +43,28 @@ def _build_parser() -> argparse.ArgumentParser:
     p_file.add_argument("--overwrite", action="store_true")
     p_file.add_argument("--provider", choices=["gemini", "openai", "anthropic", "github", "copilot-sdk"], default=None, help="LLM provider (default: gemini)")
     p_file.add_argument("--model", default="gemini-2.5-flash", help="Model name (default: gemini-2.5-flash)")
+    p_file.add_argument("--direct", action="store_true", help="Llama al modelo directo, sin Runner ni sesiones de ADK")
+    p_file.add_argument("--target-lang", default="es", help="Idioma destino (default: es)")
+    p_file.add_argument("--glossary", default=None, help="Glosario JSON de términos a forzar o no traducir")
 
     p_batch = sub.add_parser("batch", help="Traduce múltiples archivos en paralelo")
-    p_batch.add_argument("--paths", nargs="+", required=True)
+    p_batch.add_argument("--paths", nargs="+")
+    p_batch.add_argument("--in-archive", help="Lee los Markdown de un .zip/.tar/.tar.gz (en lugar de --paths)")
     p_batch.add_argument("--root", required=False)
-    p_batch.add_argument("--out-dir", required=True)
-    p_batch.add_argument("--jobs", type=int, default=4)
+    p_batch.add_argument("--out-dir")
+    p_batch.add_argument("--out-archive", help="Escribe la salida en un .zip/.tar/.tar.gz (en lugar de --out-dir)")
+    p_batch.add_argument("--jobs", type=int, default=4, help="Máximo de requests al modelo en paralelo (entre todos los archivos e idiomas)")
+    p_batch.add_argument("--io-workers", type=int, default=DEFAULT_IO_WORKERS, help=f"Threads para lectura/escritura de archivos (default: {DEFAULT_IO_WORKERS})")
     p_batch.add_argument("--overwrite", action="store_true")
     p_batch.add_argument("--fail-fast", action="store_true")
+    p_batch.add_argument("--dry-run", action="store_true", help="Solo estima requests, tokens y tiempo para --jobs; no traduce")
+    p_batch.add_argument("--max-chunk-tokens", type=int, default=DEFAULT_MAX_CHUNK_TOKENS, help=f"Archivos más grandes se parten en chunks (default: {DEFAULT_MAX_CHUNK_TOKENS})")
+    p_batch.add_argument("--resume", action="store_true", help="Reanuda una corrida interrumpida usando el journal de OUT_DIR (solo traduce lo que falta)")
     p_batch.add_argument("--provider", choices=["gemini", "openai", "anthropic", "github", "copilot-sdk"], default=None, help="LLM provider (default: gemini)")
     p_batch.add_argument("--model", default="gemini-2.5-flash", help="Model name (default: gemini-2.5-flash)")
+    p_batch.add_argument("--direct", action="store_true", help="Llama al modelo directo, sin Runner ni sesiones de ADK")
+    p_batch.add_argument("--target-langs", type=_parse_langs, default=("es",), help="Idiomas destino separados por coma (default: es). Con varios, la salida va a OUT_DIR/<lang>/")
+    p_batch.add_argument("--glossary", default=None, help="Glosario JSON de términos a forzar o no traducir")
 
     return p
 
@@ -42,12 +76,17 @@ async def _run(args: argparse.Namespace) -> int:
             jobs=1,
             model=args.model,
             provider=args.provider,
+            target_langs=(args.target_lang,),
+            direct=args.direct,
+            glossary=Path(args.glossary) if args.glossary else None,
         )
-        await translate_file(
+        missing = await translate_file(
             Path(args.in_path),
             Path(args.out_path),
             options=options,
         )
+        if missing:
+            print(f"warning: glosario no respetado: {', '.join(missing)}")
         return 0
 
     if args.cmd == "batch":
@@ -56,22 +95,63 @@ async def _run(args: argparse.Namespace) -> int:
             provider=args.provider,
             overwrite=args.overwrite,
             jobs=args.jobs,
+            target_langs=args.target_langs,
+            resume=args.resume,
+            max_chunk_tokens=args.max_chunk_tokens,
+            direct=args.direct,
+            glossary=Path(args.glossary) if args.glossary else None,
+            io_workers=args.io_workers,
         )
         root = Path(args.root) if args.root else None
-        out_dir = Path(args.out_dir)
-        inputs = [Path(p) for p in args.paths]
-
-        results = await translate_many(
-            inputs,
-            root=root,
-            out_dir=out_dir,
-            options=options,
-            continue_on_error=not args.fail_fast,
-        )
+        out_dir = Path(args.out_dir) if args.out_dir else None
+        out_archive = Path(args.out_archive) if args.out_archive else None
+        in_archive = Path(args.in_archive) if args.in_archive else None
+        inputs = [Path(p) for p in args.paths or []]
+
+        if args.dry_run:
+            if in_archive is not None:
+                plan = plan_archive(in_archive, out_dir=Path(), options=options)
+            else:
+                plan = plan_batch(inputs, root=root, out_dir=out_dir or Path(), options=options)
+            est = plan.estimate(options.jobs)
+            print(
+                f"Plan: files={est.files} langs={len(options.target_langs)} "
+                f"requests={est.requests} tokens~{est.tokens}"
+            )
+            print(
+                f"Tiempo estimado con --jobs {options.jobs}: {_fmt_seconds(est.seconds)} "
+                f"(secuencial: {_fmt_seconds(est.serial_seconds)})"
+            )
+            for k, v in plan.errors.items():
+                print(f"- {k}: {v}")
+            return 0 if not plan.errors else 2
+
+        lag = LoopLag()
+        if in_archive is not None:
+            results = await translate_archive(
+                in_archive,
+                out_dir=out_dir,
+                out_archive=out_archive,
+                options=options,
+                continue_on_error=not args.fail_fast,
+                loop_lag=lag,
+            )
+        else:
+            results = await translate_many(
+                inputs,
+                root=root,
+                out_dir=out_dir,
+                out_archive=out_archive,
+                options=options,
+                continue_on_error=not args.fail_fast,
+                loop_lag=lag,
+            )
 
         ok = sum(1 for v in results.values() if v == "ok")
-        err = sum(1 for v in results.values() if v != "ok")
-        print(f"Done. ok={ok} error={err}")
+        warn = sum(1 for v in results.values() if v.startswith("warning"))
+        err = sum(1 for v in results.values() if v.startswith("error"))
+        print(f"Done. ok={ok} warning={warn} error={err}")
+        print(f"Event loop lag: max={lag.max * 1e3:.1f}ms mean={lag.mean * 1e3:.1f}ms")
         for k, v in results.items():
             if v != "ok":
                 print(f"- {k}: {v}")
@@ -83,4 +163,9 @@ async def _run(args: argparse.Namespace) -> int:
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
+    if args.cmd == "batch":
+        if (args.paths is None) == (args.in_archive is None):
+            parser.error("batch: indique --paths o --in-archive (uno solo)")
+        if (args.out_dir is None) == (args.out_archive is None):
+            parser.error("batch: indique --out-dir o --out-archive (uno solo)")
     return asyncio.run(_run(args))
@@ -0,0 +1,149 @@
+"""Glosario de términos con índice Aho-Corasick.
+
+El glosario se carga una vez por corrida; cada request recibe solo las entradas
+que aparecen en su texto, en lugar de todo el glosario dentro de la instrucción.
+
+Formato (JSON)::
+
+    {
+      "Runner": null,
+      "agent": {"es": "agente", "pt": "agente"},
+      "session": "sesión"
+    }
+
+`null` = no traducir, objeto = traducción por idioma, string = para cualquier idioma.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class GlossaryEntry:
+    term: str
+    keep: bool = False  # True: el término se deja sin traducir
+    translations: dict[str, str] = field(default_factory=dict)
+    default: str | None = None
+
+    def target_for(self, lang: str) -> str | None:
+        """Forma esperada en la salida, o None si el término no aplica a `lang`."""
+        if self.keep:
+            return self.term
+        return self.translations.get(lang, self.default)
+
+
+class TermMatcher:
+    """Autómata Aho-Corasick (case-insensitive) sobre un conjunto fijo de términos.
+
+    `find` recorre el texto una sola vez, sin importar cuántos términos haya, y
+    solo reporta apariciones como palabra completa.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._lengths: list[int] = []
+
+        for idx, term in enumerate(terms):
+            key = term.lower()
+            self._lengths.append(len(key))
+            node = 0
+            for ch in key:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(idx)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set[int]:
+        """Índices de los términos presentes en `text`."""
+        lowered = text.lower()
+        found: set[int] = set()
+        node = 0
+        for end, ch in enumerate(lowered):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for idx in self._out[node]:
+                start = end - self._lengths[idx] + 1
+                if _is_boundary(lowered, start - 1) and _is_boundary(lowered, end + 1):
+                    found.add(idx)
+        return found
+
+
+def _is_boundary(text: str, i: int) -> bool:
+    return i < 0 or i >= len(text) or not (text[i].isalnum() or text[i] == "_")
+
+
+class Glossary:
+    def __init__(self, entries: list[GlossaryEntry]):
+        self.entries = entries
+        self._matcher = TermMatcher(e.term for e in entries)
+        # Identifica el contenido del glosario (p. ej. para no reanudar con uno distinto).
+        canonical = json.dumps([asdict(e) for e in entries], sort_keys=True, ensure_ascii=False)
+        self.digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def load(cls, path: Path) -> Glossary:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(raw, dict):
+            raise ValueError(f"Glosario inválido (se esperaba un objeto JSON): {path}")
+        entries: list[GlossaryEntry] = []
+        for term, value in raw.items():
+            if value is None:
+                entries.append(GlossaryEntry(term=term, keep=True))
+            elif isinstance(value, str):
+                entries.append(GlossaryEntry(term=term, default=value))
+            elif isinstance(value, dict):
+                entries.append(GlossaryEntry(term=term, translations={k: str(v) for k, v in value.items()}))
+            else:
+                raise ValueError(f"Entrada de glosario inválida para {term!r}: {value!r}")
+        return cls(entries)
+
+    def match(self, text: str) -> list[GlossaryEntry]:
+        return [self.entries[i] for i in sorted(self._matcher.find(text))]
+
+
+def render_glossary(entries: list[GlossaryEntry], lang: str) -> str | None:
+    """Bloque que acompaña al texto del request, o None si no hay términos para `lang`."""
+    lines: list[str] = []
+    for e in entries:
+        target = e.target_for(lang)
+        if target is None:
+            continue
+        lines.append(f"- {e.term} → {target} (no traducir)" if e.keep else f"- {e.term} → {target}")
+    if not lines:
+        return None
+    return "GLOSARIO (obligatorio):\n" + "\n".join(lines)
+
+
+def check_glossary(entries: list[GlossaryEntry], lang: str, translated: str) -> list[str]:
+    """Términos del glosario cuya forma esperada no aparece en la traducción."""
+    lowered = translated.lower()
+    missing: list[str] = []
+    for e in entries:
+        target = e.target_for(lang)
+        if target is not None and target.lower() not in lowered:
+            missing.append(f"{e.term}→{target}")
+    return missing
@@ -0,0 +1,115 @@
+"""Etapa de I/O fuera del event loop.
+
+Las lecturas, escrituras y appends al journal corren en un pool de threads
+acotado, así un filesystem lento (NFS, SMB) no frena los requests al modelo que
+están en vuelo. Las escrituras son write-behind: el worker sigue con el próximo
+request mientras la salida se escribe, con backpressure cuando hay demasiadas
+escrituras pendientes.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_IO_WORKERS = 4
+DEFAULT_MAX_PENDING_WRITES = 64
+
+
+class IOStage:
+    def __init__(self, *, workers: int = DEFAULT_IO_WORKERS, max_pending: int = DEFAULT_MAX_PENDING_WRITES):
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="adk-io")
+        self._slots = asyncio.Semaphore(max(1, max_pending))
+        self._pending: set[asyncio.Future[Any]] = set()
+        self.errors: list[BaseException] = []
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Ejecuta `fn` en el pool y espera el resultado (lecturas)."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def write_behind(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[], None] | None = None,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        """Encola `fn` y vuelve enseguida; solo espera si hay `max_pending` escrituras en curso.
+
+        Los callbacks corren en el event loop. Los errores sin `on_error` quedan en `errors`.
+        """
+        await self._slots.acquire()
+        fut = asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        self._pending.add(fut)
+
+        def _finished(f: asyncio.Future[Any]) -> None:
+            self._pending.discard(f)
+            self._slots.release()
+            if f.cancelled():
+                return
+            exc = f.exception()
+            if exc is None:
+                if on_done is not None:
+                    on_done()
+            elif on_error is not None:
+                on_error(exc)
+            else:
+                self.errors.append(exc)
+
+        fut.add_done_callback(_finished)
+
+    async def drain(self) -> None:
+        """Espera a que terminen todas las escrituras encoladas."""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+            await asyncio.sleep(0)  # deja correr los done-callbacks
+
+    async def __aenter__(self) -> IOStage:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        try:
+            await self.drain()
+        finally:
+            self.executor.shutdown(wait=True)
+
+
+@dataclass
+class LoopLag:
+    """Atraso del event loop medido con un timer periódico (en segundos)."""
+
+    max: float = 0.0
+    total: float = 0.0
+    samples: int = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.samples if self.samples else 0.0
+
+
+class LoopLagMonitor:
+    def __init__(self, lag: LoopLag, interval: float = 0.05):
+        self._lag = lag
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - start - self._interval)
+            self._lag.max = max(self._lag.max, lag)
+            self._lag.total += lag
+            self._lag.samples += 1
+
+    def __enter__(self) -> LoopLagMonitor:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
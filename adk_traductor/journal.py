@@ -0,0 +1,170 @@
+"""Write-ahead journal de unidades de traducción completadas.
+
+Cada línea es un registro JSON que se escribe (con fsync) en cuanto la unidad
+termina, así una corrida interrumpida puede reanudarse con `--resume` sin volver
+a pagar los tokens ya gastados.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+JOURNAL_NAME = ".adk_journal.jsonl"
+
+
+@dataclass(frozen=True)
+class UnitKey:
+    """Identifica la traducción de un archivo fuente concreto a un idioma y destino."""
+
+    out: str  # ruta de salida relativa al destino (--out-dir o --out-archive)
+    lang: str
+    src: str  # digest del Markdown fuente y de lo que afecta su traducción; si cambia, no se reutiliza
+
+
+def _ends_without_newline(path: Path) -> bool:
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    with open(path, "rb") as fh:
+        fh.seek(-1, os.SEEK_END)
+        return fh.read(1) != b"\n"
+
+
+def _records(path: Path) -> Iterator[tuple[UnitKey, dict[str, object]]]:
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+                unit = UnitKey(out=record["out"], lang=record["lang"], src=record["src"])
+            except (ValueError, KeyError, TypeError):
+                continue  # registro parcial (crash a mitad de escritura)
+            yield unit, record
+
+
+def check_journal(path: Path, *, resume: bool, overwrite: bool) -> None:
+    """Falla si empezar de cero borraría chunks de unidades que otra corrida no terminó.
+
+    Sin ellos, `--resume` tendría que volver a pagar esos tokens. Un journal de una
+    corrida completa (solo unidades terminadas) no bloquea.
+    """
+    if resume or overwrite or not path.exists():
+        return
+    started: set[UnitKey] = set()
+    done: set[UnitKey] = set()
+    for unit, record in _records(path):
+        (done if record.get("done") else started).add(unit)
+    if started - done:
+        raise FileExistsError(
+            f"El journal {path} tiene traducciones sin terminar de una corrida anterior "
+            "(use --resume para continuarla o --overwrite para empezar de cero)"
+        )
+
+
+class Journal:
+    def __init__(self, path: Path, *, resume: bool = False, keep_done: bool = False):
+        # keep_done: al reanudar, conserva el texto de unidades terminadas (hace falta cuando
+        # la salida se reescribe completa, p. ej. un archivo .zip nuevo en cada corrida).
+        # Los chunks escritos en esta corrida no se guardan en memoria.
+        self._path = path
+        self._keep_done = keep_done
+        self._chunks: dict[UnitKey, dict[int, str]] = {}
+        self._done: set[UnitKey] = set()
+        self._missing: dict[UnitKey, list[str]] = {}  # términos del glosario no respetados
+        # Los registros pueden llegar desde los threads de la etapa de I/O.
+        self._lock = threading.Lock()
+
+        if resume and path.exists():
+            self._replay()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        torn = resume and _ends_without_newline(path)
+        self._fh = open(path, "a" if resume else "w", encoding="utf-8")
+        if torn:
+            # Última línea truncada por un crash: la cerramos para no pegarle el siguiente registro.
+            self._fh.write("\n")
+
+    def _replay(self) -> None:
+        for unit, record in _records(self._path):
+            if record.get("done"):
+                self._done.add(unit)
+                self._missing[unit] = [str(m) for m in record.get("missing") or []]
+                if not self._keep_done:
+                    self._chunks.pop(unit, None)
+            elif (self._keep_done or unit not in self._done) and isinstance(record.get("text"), str):
+                self._chunks.setdefault(unit, {})[int(record.get("chunk", 0))] = record["text"]
+
+    def knows(self, unit: UnitKey) -> bool:
+        """True si una corrida anterior ya empezó a escribir esta unidad."""
+        return unit in self._done or unit in self._chunks
+
+    def is_done(self, unit: UnitKey) -> bool:
+        return unit in self._done
+
+    def chunk(self, unit: UnitKey, index: int) -> str | None:
+        return self._chunks.get(unit, {}).get(index)
+
+    def missing_terms(self, unit: UnitKey) -> list[str]:
+        """Términos del glosario que la unidad terminada no respetó."""
+        return self._missing.get(unit, [])
+
+    def record_chunk(self, unit: UnitKey, index: int, text: str) -> None:
+        # En memoria solo queda lo leído del disco al reanudar: lo de esta corrida ya
+        # lo tiene el pipeline hasta escribir la salida.
+        with self._lock:
+            self._append({"out": unit.out, "lang": unit.lang, "src": unit.src, "chunk": index, "text": text})
+
+    def record_done(self, unit: UnitKey, missing: list[str] | None = None) -> None:
+        with self._lock:
+            self._done.add(unit)
+            self._missing[unit] = list(missing or [])
+            self._chunks.pop(unit, None)  # la salida ya se reescribió con ese texto
+            self._append(self._done_record(unit))
+
+    def _done_record(self, unit: UnitKey) -> dict[str, object]:
+        record: dict[str, object] = {"out": unit.out, "lang": unit.lang, "src": unit.src, "done": True}
+        if self._missing.get(unit):
+            record["missing"] = self._missing[unit]
+        return record
+
+    def compact(self) -> None:
+        """Reescribe el journal sin el texto de las unidades terminadas.
+
+        Quedan los registros `done` (para `--resume` y los avisos de glosario) y los
+        chunks de unidades sin terminar; el corpus traducido no se duplica en el destino.
+        """
+        with self._lock:
+            self._fh.close()
+            fd, tmp = tempfile.mkstemp(dir=self._path.parent, prefix=f"{self._path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as out:
+                    for unit, record in _records(self._path):
+                        if unit not in self._done:
+                            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    for unit in self._done:
+                        out.write(json.dumps(self._done_record(unit), ensure_ascii=False) + "\n")
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp, self._path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            finally:
+                self._fh = open(self._path, "a", encoding="utf-8")
+
+    def _append(self, record: dict[str, object]) -> None:
+        self._fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
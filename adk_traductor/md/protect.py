@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 
 _PLACEHOLDER_FMT = "<<ADK_P{n}>>"
+_PLACEHOLDER_RE = re.compile(r"<<ADK_P\d+>>")
 
 
 @dataclass(frozen=True)
@@ -25,9 +26,11 @@ _AUTO_LINK_RE = re.compile(r"<https?://[^>]+>")
 _BARE_URL_RE = re.compile(r"https?://[^\s)\]]+")
 
 
-def protect_markdown_inline(text: str) -> ProtectedText:
+def protect_markdown_inline(text: str, *, start: int = 0) -> ProtectedText:
+    # `start` lets callers protect several segments of one document without
+    # placeholder collisions.
     mapping: dict[str, str] = {}
-    counter = 0
+    counter = start
 
     def make_placeholder(value: str) -> str:
         nonlocal counter
@@ -62,3 +65,9 @@ def unprotect(text: str, mapping: dict[str, str]) -> str:
     for key in sorted(mapping.keys(), key=len, reverse=True):
         text = text.replace(key, mapping[key])
     return text
+
+
+def missing_placeholders(source: str, translated: str) -> list[str]:
+    """Placeholders de `source` que no volvieron en `translated` (en orden de aparición)."""
+    present = set(_PLACEHOLDER_RE.findall(translated))
+    return [p for p in dict.fromkeys(_PLACEHOLDER_RE.findall(source)) if p not in present]
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Protocol
+from typing import IO, Iterator, Protocol
 
-from .adk_translate import AdkTranslateConfig, AdkTranslator
+from .adk_translate import AdkTranslateConfig, AdkTranslator, DirectAdkTranslator
+from .archive import ArchiveMember, ArchiveWriter, is_markdown, iter_members, member_path
+from .io_stage import DEFAULT_IO_WORKERS, DEFAULT_MAX_PENDING_WRITES, IOStage, LoopLag, LoopLagMonitor
+from .glossary import Glossary, GlossaryEntry, check_glossary, render_glossary
+from .journal import JOURNAL_NAME, Journal, UnitKey, check_journal
+from .md.protect import missing_placeholders, protect_markdown_inline, unprotect
+from .md.segmenter import Segment, split_markdown
+from .planner import DEFAULT_MAX_CHUNK_TOKENS, BatchEstimate, Chunk, chunk_document, estimate_batch, lpt_order
 
 
 class Translator(Protocol):
-    async def translate_text(self, text: str) -> str: ...
+    async def translate_text(self, text: str, *, glossary: str | None = None) -> str: ...
 
 
 @dataclass(frozen=True)
@@ -18,40 +33,649 @@ class TranslateOptions:
     jobs: int = 4
     model: str = "gemini-2.5-flash"
     provider: str | None = None
+    target_langs: tuple[str, ...] = ("es",)
+    resume: bool = False
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS
+    direct: bool = False
+    glossary: Path | None = None
+    io_workers: int = DEFAULT_IO_WORKERS
+    max_pending_writes: int = DEFAULT_MAX_PENDING_WRITES
 
 
-def _create_translator(options: TranslateOptions) -> Translator:
-    """Factory para crear translator - todos usan AdkTranslator ahora."""
-    return AdkTranslator(
+@dataclass(frozen=True)
+class PreparedDocument:
+    """Markdown leído, segmentado y protegido una sola vez (independiente del idioma)."""
+
+    segments: list[Segment]
+    parts: list[str]  # texto protegido de cada segmento, en paralelo a `segments`
+    mapping: dict[str, str]
+    digest: str
+
+    @property
+    def payload(self) -> str:
+        return "".join(self.parts)
+
+
+def prepare_markdown(md: str) -> PreparedDocument:
+    segments = split_markdown(md)
+    mapping: dict[str, str] = {}
+    parts: list[str] = []
+    for seg in segments:
+        # Solo el texto lleva inline code/URLs protegibles; fences y frontmatter van tal cual
+        # (el LLM traduce los comentarios dentro de los fences).
+        if seg.kind == "text":
+            protected = protect_markdown_inline(seg.text, start=len(mapping))
+            mapping.update(protected.mapping)
+            parts.append(protected.text)
+        else:
+            parts.append(seg.text)
+    return PreparedDocument(
+        segments=segments,
+        parts=parts,
+        mapping=mapping,
+        digest=hashlib.sha256(md.encode("utf-8")).hexdigest(),
+    )
+
+
+def read_document(input_path: Path) -> PreparedDocument:
+    return prepare_markdown(input_path.read_text(encoding="utf-8"))
+
+
+def _join_chunks(chunks: list[Chunk], translated: list[str]) -> str:
+    # El modelo suele recortar los saltos de línea finales; los restauramos en los
+    # cortes intermedios para no pegar el último párrafo de un chunk con el siguiente.
+    out: list[str] = []
+    for i, (chunk, text) in enumerate(zip(chunks, translated)):
+        if i < len(chunks) - 1:
+            text = text.rstrip("\n") + chunk.text[len(chunk.text.rstrip("\n")) :]
+        out.append(text)
+    return "".join(out)
+
+
+def _prose(md: str, *, first: bool) -> str:
+    """Solo el texto corrido: el glosario no aplica dentro de fences ni del frontmatter.
+
+    El frontmatter solo puede estar en el primer chunk; los demás empiezan en un límite
+    de párrafo y un `---` inicial ahí es una línea horizontal.
+    """
+    if not first:
+        md = "\n" + md  # split_markdown solo reconoce frontmatter en la primera línea
+    return "".join(seg.text for seg in split_markdown(md) if seg.kind == "text")
+
+
+async def _translate_chunk(
+    translator: Translator, text: str, terms: list[GlossaryEntry], lang: str, *, first: bool
+) -> tuple[str, list[str]]:
+    """Traduce un chunk con solo las entradas de glosario que aparecen en él.
+
+    Devuelve la traducción y los términos del glosario que no se respetaron.
+    Si el modelo pierde un placeholder, el chunk falla: unprotect no podría
+    restaurar ese inline code/URL y la salida quedaría corrupta.
+    """
+    block = render_glossary(terms, lang)
+    if block is None:
+        translated, missing = await translator.translate_text(text), []
+    else:
+        translated = await translator.translate_text(text, glossary=block)
+        missing = check_glossary(terms, lang, _prose(translated, first=first))
+    lost = missing_placeholders(text, translated)
+    if lost:
+        raise ValueError(f"La traducción perdió placeholders: {', '.join(lost)}")
+    return translated, missing
+
+
+async def translate_document(
+    doc: PreparedDocument,
+    translator: Translator,
+    *,
+    lang: str,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    glossary: Glossary | None = None,
+) -> tuple[str, list[str]]:
+    chunks = chunk_document(doc, max_chunk_tokens)
+    translated: list[str] = []
+    missing: list[str] = []
+    for i, c in enumerate(chunks):
+        terms = glossary.match(c.prose) if glossary else []
+        text, chunk_missing = await _translate_chunk(translator, c.text, terms, lang, first=i == 0)
+        translated.append(text)
+        missing.extend(chunk_missing)
+    return unprotect(_join_chunks(chunks, translated), doc.mapping), missing
+
+
+def _create_translator(options: TranslateOptions, target_lang: str) -> Translator:
+    """Factory para crear translator: Runner de ADK o llamada directa al modelo (`direct`)."""
+    cls = DirectAdkTranslator if options.direct else AdkTranslator
+    return cls(
         AdkTranslateConfig(
             model=options.model,
             provider=options.provider,
+            target_lang=target_lang,
         )
     )
 
 
-async def translate_file(input_path: Path, output_path: Path, *, options: TranslateOptions) -> None:
+def _write_output(output_path: Path, content: str | IO[bytes], *, make_parent: bool = True) -> None:
+    """Escritura atómica: temp file en el mismo directorio + rename.
+
+    Un proceso interrumpido nunca deja un archivo de salida a medio escribir.
+    `content` es texto, o un stream binario que se copia sin decodificar.
+    """
+    if make_parent:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    try:
+        if isinstance(content, str):
+            fh = os.fdopen(fd, "w", encoding="utf-8")
+        else:
+            fh = os.fdopen(fd, "wb")
+        with fh:
+            if isinstance(content, str):
+                fh.write(content)
+            else:
+                shutil.copyfileobj(content, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, output_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+async def translate_file(input_path: Path, output_path: Path, *, options: TranslateOptions) -> list[str]:
+    """Traduce un archivo al primer idioma de `options.target_langs`.
+
+    Devuelve los términos del glosario que la traducción no respetó.
+    """
     if output_path.exists() and not options.overwrite:
         raise FileExistsError(f"Output exists: {output_path}")
-    md = input_path.read_text(encoding="utf-8")
-    translator = _create_translator(options)
-    translated = await translator.translate_text(md)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(translated, encoding="utf-8")
-
-
-async def translate_many(inputs: list[Path], *, root: Path | None, out_dir: Path, options: TranslateOptions, continue_on_error: bool = True) -> dict[str, str]:
-    semaphore = asyncio.Semaphore(max(1, options.jobs))
-    results: dict[str, str] = {}
-    async def run_one(p: Path) -> None:
-        async with semaphore:
-            try:
-                rel = p if root is None else p.relative_to(root)
-                await translate_file(p, out_dir / rel, options=options)
-                results[str(p)] = "ok"
-            except Exception as e:
-                results[str(p)] = f"error: {e}"
-                if not continue_on_error:
-                    raise
-    await asyncio.gather(*[run_one(p) for p in inputs], return_exceptions=continue_on_error)
+    glossary = Glossary.load(options.glossary) if options.glossary else None
+    doc = await asyncio.to_thread(read_document, input_path)
+    lang = options.target_langs[0]
+    translator = _create_translator(options, lang)
+    translated, missing = await translate_document(
+        doc, translator, lang=lang, max_chunk_tokens=options.max_chunk_tokens, glossary=glossary
+    )
+    await asyncio.to_thread(_write_output, output_path, translated)
+    return missing
+
+
+def output_path_for(rel: Path, lang: str, *, out_dir: Path, options: TranslateOptions) -> Path:
+    """Con un solo idioma se conserva `out_dir/rel`; con varios, `out_dir/<lang>/rel`."""
+    if len(options.target_langs) == 1:
+        return out_dir / rel
+    return out_dir / lang / rel
+
+
+def result_key(p: Path, lang: str, options: TranslateOptions) -> str:
+    if len(options.target_langs) == 1:
+        return str(p)
+    return f"{p} [{lang}]"
+
+
+@dataclass(frozen=True)
+class BatchTarget:
+    """Un archivo fuente traducido a un idioma: uno o más chunks (requests)."""
+
+    source: Path
+    lang: str
+    out: Path
+    name: str  # `out` relativa al destino: clave del journal, sin importar cómo se pasó --out-dir
+    doc: PreparedDocument
+    chunks: list[Chunk]
+    terms: list[list[GlossaryEntry]]  # entradas de glosario presentes en cada chunk
+
+
+@dataclass
+class BatchPlan:
+    files: int
+    targets: list[BatchTarget]
+    errors: dict[str, str]  # result_key -> error de lectura/parseo
+
+    def estimate(self, jobs: int) -> BatchEstimate:
+        return estimate_batch(self.files, [c.tokens for t in self.targets for c in t.chunks], jobs)
+
+
+def _add_document(
+    plan: BatchPlan,
+    source: Path,
+    rel: Path,
+    doc: PreparedDocument,
+    *,
+    out_dir: Path,
+    options: TranslateOptions,
+    glossary: Glossary | None,
+) -> None:
+    plan.files += 1
+    chunks = chunk_document(doc, options.max_chunk_tokens)
+    # Un solo escaneo por chunk, compartido por todos los idiomas.
+    terms = [glossary.match(c.prose) if glossary else [] for c in chunks]
+    for lang in options.target_langs:
+        name = output_path_for(rel, lang, out_dir=Path(), options=options)
+        plan.targets.append(
+            BatchTarget(
+                source=source, lang=lang, out=out_dir / name, name=name.as_posix(), doc=doc, chunks=chunks, terms=terms
+            )
+        )
+
+
+def _record_plan_error(plan: BatchPlan, source: Path, e: Exception, options: TranslateOptions) -> None:
+    for lang in options.target_langs:
+        plan.errors[result_key(source, lang, options)] = f"error: {e}"
+
+
+def _try_read(p: Path) -> str | Exception:
+    try:
+        return p.read_text(encoding="utf-8")
+    except Exception as e:
+        return e
+
+
+def plan_batch(
+    inputs: list[Path],
+    *,
+    root: Path | None,
+    out_dir: Path,
+    options: TranslateOptions,
+    continue_on_error: bool = True,
+    glossary: Glossary | None = None,
+    executor: Executor | None = None,
+) -> BatchPlan:
+    """Lee y parsea cada archivo una vez y lo reparte en chunks por idioma.
+
+    Con `executor`, las lecturas se adelantan en paralelo (prefetch) y se
+    consumen en orden. El parseo queda en este thread: repartido entre los
+    workers de I/O competiría por el GIL con el event loop.
+    """
+    plan = BatchPlan(files=0, targets=[], errors={})
+    texts = executor.map(_try_read, inputs) if executor is not None else map(_try_read, inputs)
+    for p, md in zip(inputs, texts):
+        try:
+            rel = p if root is None else p.relative_to(root)
+            if isinstance(md, Exception):
+                raise md
+            doc = prepare_markdown(md)
+        except Exception as e:
+            _record_plan_error(plan, p, e, options)
+            if not continue_on_error:
+                raise
+            continue
+        _add_document(plan, p, rel, doc, out_dir=out_dir, options=options, glossary=glossary)
+    return plan
+
+
+def plan_archive(
+    in_archive: Path,
+    *,
+    out_dir: Path,
+    options: TranslateOptions,
+    continue_on_error: bool = True,
+    glossary: Glossary | None = None,
+    sink: _Sink | None = None,
+) -> BatchPlan:
+    """Recorre el archivo una sola vez: planifica los Markdown y copia el resto a `sink`.
+
+    Los miembros que no son Markdown se copian como bytes, sin decodificarlos
+    (con varios idiomas, una copia bajo cada `<lang>/`). Los miembros con rutas que
+    escaparían del destino se rechazan como error.
+    """
+    plan = BatchPlan(files=0, targets=[], errors={})
+    for member in iter_members(in_archive):
+        try:
+            rel = Path(member_path(member.name))
+            if not is_markdown(member.name):
+                if sink is not None:
+                    _copy_member(sink, member, rel, out_dir=out_dir, options=options)
+                continue
+            with member.open() as fh:
+                doc = prepare_markdown(fh.read().decode("utf-8"))
+        except Exception as e:
+            _record_plan_error(plan, Path(member.name), e, options)
+            if not continue_on_error:
+                raise
+            continue
+        _add_document(plan, rel, rel, doc, out_dir=out_dir, options=options, glossary=glossary)
+    return plan
+
+
+def _copy_member(sink: _Sink, member: ArchiveMember, rel: Path, *, out_dir: Path, options: TranslateOptions) -> None:
+    outs = [output_path_for(rel, lang, out_dir=out_dir, options=options) for lang in options.target_langs]
+    with member.open() as src:
+        if len(outs) == 1:
+            sink.copy(outs[0], src, member.size, member.mtime)
+            return
+        # Un stream de tar no se puede releer: se bufferiza una vez (en disco si es grande).
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buf:
+            shutil.copyfileobj(src, buf)
+            for out in outs:
+                buf.seek(0)
+                sink.copy(out, buf, member.size, member.mtime)
+
+
+class _Sink(Protocol):
+    journal_path: Path
+    keep_done: bool  # la salida se reescribe completa: el journal conserva el texto de lo terminado
+
+    def exists(self, out: Path) -> bool: ...
+    def write_text(self, out: Path, text: str) -> None: ...
+    def copy(self, out: Path, src: IO[bytes], size: int, mtime: float) -> None: ...
+    def finish_journal(self, journal: Journal, *, clean: bool) -> None: ...
+
+
+def _same_bytes(path: Path, src: IO[bytes], size: int) -> bool:
+    if path.stat().st_size != size:
+        return False
+    with open(path, "rb") as fh:
+        while True:
+            block = src.read(1024 * 1024)
+            if block != fh.read(len(block)):
+                return False
+            if not block:
+                return True
+
+
+class _DirSink:
+    keep_done = False
+
+    def __init__(self, out_dir: Path, *, overwrite: bool = False):
+        self.journal_path = out_dir / JOURNAL_NAME
+        self._overwrite = overwrite
+        # mkdir una sola vez por directorio, no una por archivo.
+        self._dirs: set[Path] = set()
+        self._lock = threading.Lock()
+
+    def _ensure_dir(self, path: Path) -> None:
+        with self._lock:
+            if path in self._dirs:
+                return
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._dirs.add(path)
+
+    def exists(self, out: Path) -> bool:
+        return out.exists()
+
+    def write_text(self, out: Path, text: str) -> None:
+        self._ensure_dir(out.parent)
+        _write_output(out, text, make_parent=False)
+
+    def copy(self, out: Path, src: IO[bytes], size: int, mtime: float) -> None:
+        # Igual que con las salidas Markdown, un archivo existente solo se pisa con
+        # --overwrite; una copia idéntica (p. ej. de la corrida que se reanuda) se deja.
+        if not self._overwrite and out.exists():
+            if _same_bytes(out, src, size):
+                return
+            raise FileExistsError(f"Output exists: {out}")
+        self._ensure_dir(out.parent)
+        _write_output(out, src, make_parent=False)
+
+    def finish_journal(self, journal: Journal, *, clean: bool) -> None:
+        # Las salidas terminadas ya están en disco: su texto no hace falta en el journal.
+        journal.compact()
+
+
+class _ArchiveSink:
+    keep_done = True
+
+    def __init__(self, writer: ArchiveWriter):
+        self._writer = writer
+        self.drop_journal = False
+        self._lock = threading.Lock()  # zipfile/tarfile no admiten escrituras concurrentes
+        self.journal_path = self.journal_path_for(writer.path)
+
+    @staticmethod
+    def journal_path_for(path: Path) -> Path:
+        return path.parent / f".{path.name}{JOURNAL_NAME}"
+
+    @staticmethod
+    def _member_name(out: Path) -> str:
+        # Sin --root, `out` es la ruta de entrada tal cual (absoluta o con `..`): no se
+        # generan archivos que escaparían del destino al extraerlos.
+        return member_path(out.as_posix()).as_posix()
+
+    def exists(self, out: Path) -> bool:
+        self._member_name(out)  # un nombre inválido falla antes de traducir
+        return False  # cada corrida escribe un archivo nuevo
+
+    def write_text(self, out: Path, text: str) -> None:
+        name = self._member_name(out)
+        with self._lock:
+            self._writer.add_text(name, text)
+
+    def copy(self, out: Path, src: IO[bytes], size: int, mtime: float) -> None:
+        name = self._member_name(out)
+        with self._lock:
+            self._writer.add_stream(name, src, size, mtime)
+
+    def finish_journal(self, journal: Journal, *, clean: bool) -> None:
+        # Reanudar reescribe el archivo completo y necesita el texto de todo lo terminado:
+        # el journal se conserva entero, salvo que la corrida haya salido limpia (entonces
+        # se borra, pero recién cuando el archivo de salida quedó confirmado).
+        self.drop_journal = clean
+
+
+def _try_exists(sink: _Sink, out: Path) -> bool | Exception:
+    try:
+        return sink.exists(out)
+    except Exception as e:
+        return e
+
+
+@contextmanager
+def _open_sink(out_dir: Path | None, out_archive: Path | None, options: TranslateOptions) -> Iterator[tuple[_Sink, Path]]:
+    """Devuelve el sink y el directorio base de las rutas de salida."""
+    if (out_dir is None) == (out_archive is None):
+        raise ValueError("Indique exactamente uno de out_dir u out_archive")
+    # Antes de planificar: plan_archive ya copia miembros al sink.
+    if out_dir is not None:
+        sink = _DirSink(out_dir, overwrite=options.overwrite)
+        check_journal(sink.journal_path, resume=options.resume, overwrite=options.overwrite)
+        yield sink, out_dir
+        return
+    if out_archive.exists() and not options.overwrite and not options.resume:
+        raise FileExistsError(f"Output exists: {out_archive}")
+    check_journal(_ArchiveSink.journal_path_for(out_archive), resume=options.resume, overwrite=options.overwrite)
+    with ArchiveWriter(out_archive) as writer:
+        sink = _ArchiveSink(writer)
+        yield sink, Path()
+    if sink.drop_journal:
+        sink.journal_path.unlink(missing_ok=True)
+
+
+def _status(missing_terms: list[str]) -> str:
+    if missing_terms:
+        return f"warning: glosario no respetado: {', '.join(missing_terms)}"
+    return "ok"
+
+
+@dataclass
+class _Run:
+    key: str
+    unit: UnitKey
+    translated: dict[int, str] = field(default_factory=dict)
+    missing_terms: list[str] = field(default_factory=list)
+    failed: bool = False
+
+
+async def _run_plan(
+    plan: BatchPlan,
+    *,
+    sink: _Sink,
+    io: IOStage,
+    options: TranslateOptions,
+    continue_on_error: bool,
+    glossary: Glossary | None,
+) -> dict[str, str]:
+    """Ejecuta `plan` y lo consume: cada documento se libera cuando su salida queda escrita."""
+    results: dict[str, str] = dict(plan.errors)
+    translators = {lang: _create_translator(options, lang) for lang in options.target_langs}
+
+    def fail(run: _Run, e: BaseException) -> None:
+        run.failed = True
+        results[run.key] = f"error: {e}"
+
+    def write_failed(run: _Run, e: BaseException) -> None:
+        # Escrituras en segundo plano (salida o journal): el error es de esa unidad;
+        # solo con fail-fast corta la corrida.
+        fail(run, e)
+        if not continue_on_error:
+            io.errors.append(e)
+
+    async def finish(run: _Run, t: BatchTarget, journal: Journal) -> None:
+        translated = [run.translated[i] for i in range(len(t.chunks))]
+        run.translated.clear()  # a partir de acá, solo el commit encolado referencia el texto
+
+        def commit() -> None:
+            # Armar la salida también va al thread: el event loop solo despacha requests.
+            sink.write_text(t.out, unprotect(_join_chunks(t.chunks, translated), t.doc.mapping))
+            journal.record_done(run.unit, run.missing_terms)
+
+        def done() -> None:
+            if not run.failed:  # p. ej. falló el append de un chunk al journal
+                results[run.key] = _status(run.missing_terms)
+
+        # Write-behind: el worker sigue con el próximo request mientras se escribe.
+        await io.write_behind(commit, on_done=done, on_error=lambda e: write_failed(run, e))
+
+    # Todo lo que cambia la traducción forma parte de la clave: otro tamaño de chunk cambia
+    # los índices, y otro modelo o glosario invalida los chunks ya traducidos.
+    config = "/".join(
+        (str(options.max_chunk_tokens), options.provider or "", options.model, glossary.digest if glossary else "")
+    )
+    journal = await io.run(
+        lambda: Journal(sink.journal_path, resume=options.resume, keep_done=sink.keep_done)
+    )
+    with journal:
+        workers: list[asyncio.Task[None]] = []
+        try:
+            pending: list[tuple[_Run, BatchTarget, int]] = []
+            # Un solo viaje al pool para todo el lote, no uno por salida.
+            existing = await io.run(lambda: [_try_exists(sink, t.out) for t in plan.targets])
+            for t, exists in zip(plan.targets, existing):
+                unit = UnitKey(out=t.name, lang=t.lang, src=f"{t.doc.digest}/{config}")
+                run = _Run(key=result_key(t.source, t.lang, options), unit=unit)
+                try:
+                    if isinstance(exists, Exception):
+                        raise exists
+                    if journal.is_done(unit) and exists:
+                        results[run.key] = _status(journal.missing_terms(unit))
+                        continue
+                    # Una salida existente solo se pisa si es nuestra (quedó registrada en el journal).
+                    if exists and not options.overwrite and not journal.knows(unit):
+                        raise FileExistsError(f"Output exists: {t.out}")
+                    for i in range(len(t.chunks)):
+                        cached = journal.chunk(unit, i)
+                        if cached is None:
+                            pending.append((run, t, i))
+                        else:
+                            run.translated[i] = cached
+                            run.missing_terms.extend(check_glossary(t.terms[i], t.lang, _prose(cached, first=i == 0)))
+                    if len(run.translated) == len(t.chunks):
+                        await finish(run, t, journal)
+                except Exception as e:
+                    fail(run, e)
+                    if not continue_on_error:
+                        raise
+            # Desde acá cada documento queda referenciado solo por sus chunks pendientes.
+            plan.targets.clear()
+
+            # LPT: los chunks más grandes primero, repartidos entre `jobs` workers.
+            queue = deque(lpt_order(pending, weight=lambda item: item[1].chunks[item[2]].tokens))
+            pending.clear()
+
+            async def worker() -> None:
+                while queue:
+                    if io.errors and not continue_on_error:
+                        raise io.errors[0]
+                    run, t, i = queue.popleft()
+                    if run.failed:
+                        continue
+                    try:
+                        text, missing = await _translate_chunk(
+                            translators[t.lang], t.chunks[i].text, t.terms[i], t.lang, first=i == 0
+                        )
+                        run.missing_terms.extend(missing)
+                        run.translated[i] = text
+                        await io.write_behind(
+                            journal.record_chunk, run.unit, i, text, on_error=lambda e, run=run: write_failed(run, e)
+                        )
+                        if len(run.translated) == len(t.chunks):
+                            await finish(run, t, journal)
+                    except Exception as e:
+                        fail(run, e)
+                        if not continue_on_error:
+                            raise
+
+            workers = [asyncio.create_task(worker()) for _ in range(max(1, options.jobs))]
+            await asyncio.gather(*workers)
+        finally:
+            # Con fail-fast, el primer error (aquí o en la planificación de arriba) cancela
+            # al resto; las escrituras encoladas terminan antes de cerrar el journal.
+            for w in workers:
+                w.cancel()
+            await io.drain()
+        if io.errors and not continue_on_error:
+            raise io.errors[0]
+        clean = not any(v.startswith("error") for v in results.values())
+        await io.run(lambda: sink.finish_journal(journal, clean=clean))
     return results
+
+
+async def translate_many(
+    inputs: list[Path],
+    *,
+    root: Path | None,
+    out_dir: Path | None = None,
+    out_archive: Path | None = None,
+    options: TranslateOptions,
+    continue_on_error: bool = True,
+    loop_lag: LoopLag | None = None,
+) -> dict[str, str]:
+    """Traduce `inputs` a `out_dir` (o a `out_archive`).
+
+    Si se pasa `loop_lag`, se completa con el atraso medido del event loop.
+    """
+    glossary = Glossary.load(options.glossary) if options.glossary else None
+    with LoopLagMonitor(loop_lag or LoopLag()), _open_sink(out_dir, out_archive, options) as (sink, base):
+        async with IOStage(workers=options.io_workers, max_pending=options.max_pending_writes) as io:
+            plan = await asyncio.to_thread(
+                plan_batch,
+                inputs,
+                root=root,
+                out_dir=base,
+                options=options,
+                continue_on_error=continue_on_error,
+                glossary=glossary,
+                executor=io.executor,
+            )
+            return await _run_plan(
+                plan, sink=sink, io=io, options=options, continue_on_error=continue_on_error, glossary=glossary
+            )
+
+
+async def translate_archive(
+    in_archive: Path,
+    *,
+    out_dir: Path | None = None,
+    out_archive: Path | None = None,
+    options: TranslateOptions,
+    continue_on_error: bool = True,
+    loop_lag: LoopLag | None = None,
+) -> dict[str, str]:
+    """Como `translate_many`, pero leyendo los miembros de un .zip/.tar/.tar.gz."""
+    glossary = Glossary.load(options.glossary) if options.glossary else None
+    with LoopLagMonitor(loop_lag or LoopLag()), _open_sink(out_dir, out_archive, options) as (sink, base):
+        async with IOStage(workers=options.io_workers, max_pending=options.max_pending_writes) as io:
+            # El archivo se lee secuencialmente; todo el recorrido va fuera del event loop.
+            plan = await asyncio.to_thread(
+                plan_archive,
+                in_archive,
+                out_dir=base,
+                options=options,
+                continue_on_error=continue_on_error,
+                glossary=glossary,
+                sink=sink,
+            )
+            return await _run_plan(
+                plan, sink=sink, io=io, options=options, continue_on_error=continue_on_error, glossary=glossary
+            )
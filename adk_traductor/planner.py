@@ -0,0 +1,104 @@
+"""Planificación de lotes: estimación de trabajo, chunking de outliers y orden LPT.
+
+Las estimaciones son heurísticas (sin tokenizer): sirven para ordenar el trabajo
+y para dar un orden de magnitud en `--dry-run`, no para facturar.
+"""
+from __future__ import annotations
+
+import heapq
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, TypeVar
+
+if TYPE_CHECKING:
+    from .pipeline import PreparedDocument
+
+
+CHARS_PER_TOKEN = 4
+DEFAULT_MAX_CHUNK_TOKENS = 6000
+
+# Modelo de costo para la proyección de tiempo: latencia fija por request + generación.
+SECONDS_PER_REQUEST = 2.0
+TOKENS_PER_SECOND = 120.0
+
+# Corta un segmento de texto después de cada línea en blanco (límite de párrafo).
+_PARAGRAPH_SPLIT_RE = re.compile(r"(?<=\n\n)")
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class Chunk:
+    text: str
+    tokens: int  # tokens traducibles: texto fuera de fences y frontmatter
+    prose: str = ""  # ese mismo texto, sin fences ni frontmatter (lo que se busca en el glosario)
+
+
+def chunk_document(doc: PreparedDocument, max_tokens: int = DEFAULT_MAX_CHUNK_TOKENS) -> list[Chunk]:
+    """Parte un documento en chunks de como mucho `max_tokens` tokens traducibles.
+
+    Solo se corta entre segmentos o entre párrafos; un fence o un párrafo más
+    grande que el límite queda entero. Un documento normal da un único chunk.
+    """
+    pieces: list[tuple[str, int, bool]] = []
+    for seg, part in zip(doc.segments, doc.parts):
+        if seg.kind != "text":
+            pieces.append((part, 0, False))
+            continue
+        pieces.extend((p, estimate_tokens(p), True) for p in _PARAGRAPH_SPLIT_RE.split(part) if p)
+
+    chunks: list[Chunk] = []
+    buf: list[str] = []
+    prose: list[str] = []
+    tokens = 0
+    for text, n, is_prose in pieces:
+        if tokens > 0 and tokens + n > max_tokens:
+            chunks.append(Chunk(text="".join(buf), tokens=tokens, prose="".join(prose)))
+            buf, prose, tokens = [], [], 0
+        buf.append(text)
+        if is_prose:
+            prose.append(text)
+        tokens += n
+    if buf or not chunks:
+        chunks.append(Chunk(text="".join(buf), tokens=tokens, prose="".join(prose)))
+    return chunks
+
+
+def lpt_order(items: Iterable[T], weight: Callable[[T], int]) -> list[T]:
+    """Longest Processing Time first: el trabajo más grande arranca primero."""
+    return sorted(items, key=weight, reverse=True)
+
+
+def request_seconds(tokens: int) -> float:
+    return SECONDS_PER_REQUEST + tokens / TOKENS_PER_SECOND
+
+
+def projected_seconds(token_counts: Iterable[int], jobs: int) -> float:
+    """Makespan de repartir los requests en orden LPT sobre `jobs` workers."""
+    loads = [0.0] * max(1, jobs)
+    for tokens in sorted(token_counts, reverse=True):
+        heapq.heapreplace(loads, loads[0] + request_seconds(tokens))
+    return max(loads)
+
+
+@dataclass(frozen=True)
+class BatchEstimate:
+    files: int
+    requests: int
+    tokens: int
+    seconds: float
+    serial_seconds: float
+
+
+def estimate_batch(files: int, token_counts: list[int], jobs: int) -> BatchEstimate:
+    return BatchEstimate(
+        files=files,
+        requests=len(token_counts),
+        tokens=sum(token_counts),
+        seconds=projected_seconds(token_counts, jobs),
+        serial_seconds=sum(request_seconds(t) for t in token_counts),
+    )
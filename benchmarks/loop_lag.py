@@ -0,0 +1,65 @@
+"""Atraso del event loop y tiempo total de `translate_many` sobre un lote grande.
+
+Usa un translator falso con latencia fija, así lo que se mide es el pipeline
+(planificación, journal, escrituras) y no el provider.
+
+    uv run benchmarks/loop_lag.py --files 2000 --jobs 32
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from adk_traductor import pipeline
+from adk_traductor.io_stage import LoopLag
+from adk_traductor.pipeline import TranslateOptions, translate_many
+
+
+class SleepTranslator:
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+        await asyncio.sleep(self._latency)
+        return text
+
+
+def _write_docs(root: Path, files: int) -> list[Path]:
+    body = "".join(f"Paragraph {i} with `code` and https://example.com/{i}.\n\n" for i in range(40))
+    body += "```python\nprint('hi')\n```\n"
+    paths = []
+    for i in range(files):
+        p = root / f"d{i % 20}" / f"doc{i}.md"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(f"# Doc {i}\n\n{body}", encoding="utf-8")
+        paths.append(p)
+    return paths
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--jobs", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.005, help="Segundos por request del translator falso")
+    args = parser.parse_args()
+
+    pipeline._create_translator = lambda options, lang: SleepTranslator(args.latency)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "docs"
+        inputs = _write_docs(root, args.files)
+        lag = LoopLag()
+        start = time.perf_counter()
+        results = await translate_many(
+            inputs, root=root, out_dir=Path(tmp) / "out", options=TranslateOptions(jobs=args.jobs), loop_lag=lag
+        )
+        elapsed = time.perf_counter() - start
+    ok = sum(v == "ok" for v in results.values())
+    print(f"files={args.files} ok={ok} jobs={args.jobs} tiempo={elapsed:.2f}s")
+    print(f"loop lag: max={lag.max * 1e3:.1f}ms mean={lag.mean * 1e3:.1f}ms samples={lag.samples}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Overhead por llamada: Runner de ADK vs. llamada directa al modelo.
+
+Usa un `BaseLlm` que devuelve el texto tal cual, así lo que se mide es solo la
+orquestación (sesiones, eventos, Runner) y no la latencia del provider.
+
+    uv run benchmarks/translator_overhead.py --calls 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+import tracemalloc
+from typing import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+from adk_traductor.adk_translate import AdkTranslateConfig, AdkTranslator, DirectAdkTranslator
+
+
+class EchoLlm(BaseLlm):
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        yield LlmResponse(content=llm_request.contents[-1], partial=False, turn_complete=True)
+
+
+class _EchoRunner(AdkTranslator):
+    def _prepare_model_config(self) -> str | object:
+        return EchoLlm(model="echo")
+
+
+class _EchoDirect(DirectAdkTranslator):
+    def _prepare_model_config(self) -> str | object:
+        return EchoLlm(model="echo")
+
+
+async def _bench(translator: AdkTranslator, calls: int, text: str) -> tuple[float, float]:
+    await translator.translate_text(text)  # warm-up
+    start = time.perf_counter()
+    for _ in range(calls):
+        await translator.translate_text(text)
+    elapsed = time.perf_counter() - start
+
+    # Memoria en una pasada aparte: tracemalloc distorsiona los tiempos.
+    tracemalloc.start()
+    for _ in range(calls):
+        await translator.translate_text(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / calls, peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)  # ADK avisa por cada llamada sin usage metadata
+    os.environ.setdefault("GOOGLE_API_KEY", "benchmark")  # EchoLlm no la usa
+    text = "Some *Markdown* paragraph to translate.\n" * 50
+    config = AdkTranslateConfig()
+
+    for name, translator in (("runner", _EchoRunner(config)), ("direct", _EchoDirect(config))):
+        per_call, peak = await _bench(translator, args.calls, text)
+        print(f"{name:>6}: {per_call * 1e3:7.3f} ms/llamada  pico memoria {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
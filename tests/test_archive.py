@@ -0,0 +1,139 @@
+"""Tests de entrada/salida en archivos comprimidos (translator falso)."""
+
+import asyncio
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from adk_traductor import pipeline
+from adk_traductor.pipeline import TranslateOptions, translate_archive, translate_many
+
+
+class EchoTranslator:
+    def __init__(self, lang: str):
+        self.lang = lang
+
+    async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+        return f"[{self.lang}]{text}"
+
+
+def _make_tgz(path: Path, members: dict[str, bytes]) -> None:
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+def test_translate_archive_tgz_to_zip(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: EchoTranslator(lang))
+    logo = b"\x89PNG\x00\xff\xfe"
+    src = tmp_path / "docs.tar.gz"
+    _make_tgz(src, {"docs/index.md": b"Hello\n", "docs/img/logo.png": logo})
+    out = tmp_path / "site.zip"
+
+    results = asyncio.run(
+        translate_archive(src, out_archive=out, options=TranslateOptions(target_langs=("es", "pt")))
+    )
+
+    assert set(results.values()) == {"ok"}
+    with zipfile.ZipFile(out) as zf:
+        assert sorted(zf.namelist()) == [
+            "es/docs/img/logo.png",
+            "es/docs/index.md",
+            "pt/docs/img/logo.png",
+            "pt/docs/index.md",
+        ]
+        assert zf.read("pt/docs/index.md") == b"[pt]Hello\n"
+        assert zf.read("es/docs/img/logo.png") == logo  # copiado sin decodificar
+    assert not list(tmp_path.glob(".site.zip.*.tmp"))
+    assert not (tmp_path / ".site.zip.adk_journal.jsonl").exists()  # corrida limpia: sin journal
+
+
+def test_translate_archive_discards_partial_output_on_failure(tmp_path: Path, monkeypatch):
+    class Boom:
+        async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: Boom())
+    src = tmp_path / "docs.tar"
+    _make_tgz(src, {"a.md": b"Hello\n"})
+    out = tmp_path / "out.tar"
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            translate_archive(src, out_archive=out, options=TranslateOptions(), continue_on_error=False)
+        )
+
+    assert not out.exists()
+    assert not list(tmp_path.glob(".out.tar.*.tmp"))
+
+
+@pytest.mark.parametrize("fmt", ["tar", "zip"])
+def test_translate_archive_rejects_members_outside_out_dir(tmp_path: Path, monkeypatch, fmt: str):
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: EchoTranslator(lang))
+    members = {
+        "docs/ok.md": b"Hello\n",
+        "../escaped.md": b"Hello\n",
+        "docs/../../up.txt": b"x",
+        str(tmp_path / "abs.txt"): b"x",
+        "C:/win.md": b"Hello\n",
+    }
+    src = tmp_path / f"evil.{fmt}"
+    if fmt == "zip":
+        with zipfile.ZipFile(src, "w") as zf:
+            for name, data in members.items():
+                zf.writestr(zipfile.ZipInfo(name), data)  # ZipInfo conserva el nombre crudo
+    else:
+        _make_tgz(src, members)
+    out = tmp_path / "work" / "out"
+
+    results = asyncio.run(translate_archive(src, out_dir=out, options=TranslateOptions()))
+
+    assert results.pop("docs/ok.md") == "ok"
+    assert len(results) == 4
+    assert all(v.startswith("error: Ruta de miembro insegura") for v in results.values())
+    written = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file())
+    assert written == [f"evil.{fmt}", "work/out/.adk_journal.jsonl", "work/out/docs/ok.md"]
+
+
+def test_translate_archive_copies_respect_overwrite(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: EchoTranslator(lang))
+    src = tmp_path / "docs.tar"
+    _make_tgz(src, {"same.png": b"png", "other.png": b"new"})
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "same.png").write_bytes(b"png")
+    (out / "other.png").write_bytes(b"mine")
+
+    results = asyncio.run(translate_archive(src, out_dir=out, options=TranslateOptions()))
+
+    assert results == {"other.png": f"error: Output exists: {out / 'other.png'}"}
+    assert (out / "other.png").read_bytes() == b"mine"
+
+    results = asyncio.run(translate_archive(src, out_dir=out, options=TranslateOptions(overwrite=True)))
+
+    assert results == {}
+    assert (out / "other.png").read_bytes() == b"new"
+
+
+def test_translate_many_to_archive_rejects_paths_outside_root(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: EchoTranslator(lang))
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("Hello\n", encoding="utf-8")
+    monkeypatch.chdir(docs)
+    out = tmp_path / "site.zip"
+
+    # Sin --root, las rutas de entrada se usan tal cual como nombres de miembro.
+    inputs = [Path("a.md"), tmp_path / "docs" / "a.md", Path("../docs/a.md")]
+    results = asyncio.run(translate_many(inputs, root=None, out_archive=out, options=TranslateOptions()))
+
+    assert results.pop("a.md") == "ok"
+    assert len(results) == 2
+    assert all(v.startswith("error: Ruta de miembro insegura") for v in results.values())
+    with zipfile.ZipFile(out) as zf:
+        assert zf.namelist() == ["a.md"]
@@ -1,7 +1,7 @@
 """Tests básicos para validar segmentación y protección."""
 
 from adk_traductor.md.segmenter import split_markdown, join_segments
-from adk_traductor.md.protect import protect_markdown_inline, unprotect
+from adk_traductor.md.protect import missing_placeholders, protect_markdown_inline, unprotect
 
 
 def test_segmenter_preserves_structure():
@@ -47,6 +47,14 @@ def test_protect_urls():
     assert restored == text
 
 
+def test_missing_placeholders():
+    protected = protect_markdown_inline("Use `a`, `b` and https://example.com")
+
+    assert missing_placeholders(protected.text, protected.text) == []
+    dropped = protected.text.replace("<<ADK_P1>>", "")
+    assert missing_placeholders(protected.text, dropped) == ["<<ADK_P1>>"]
+
+
 if __name__ == "__main__":
     test_segmenter_preserves_structure()
     print("✓ test_segmenter_preserves_structure")
@@ -0,0 +1,42 @@
+"""Tests del translator directo (sin Runner) con un modelo falso."""
+
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from adk_traductor.adk_translate import AdkTranslateConfig, DirectAdkTranslator
+
+
+class RecordingLlm(BaseLlm):
+    requests: list[LlmRequest] = []
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.requests.append(llm_request)
+        yield LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text="pensando...", thought=True), types.Part(text="Hola")],
+            ),
+        )
+
+
+class _Direct(DirectAdkTranslator):
+    def _prepare_model_config(self) -> str | object:
+        return RecordingLlm(model="fake")
+
+
+def test_direct_translator_sends_instruction_and_text(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    translator = _Direct(AdkTranslateConfig(target_lang="pt"))
+
+    assert asyncio.run(translator.translate_text("Hello")) == "Hola"
+
+    (request,) = translator._llm.requests
+    assert "portugués" in request.config.system_instruction
+    assert request.contents[-1].parts[0].text == "Hello"
@@ -0,0 +1,26 @@
+"""Tests del glosario (matcher Aho-Corasick y post-check)."""
+
+from adk_traductor.glossary import Glossary, GlossaryEntry, TermMatcher, check_glossary, render_glossary
+
+
+def test_term_matcher_finds_whole_words_case_insensitive():
+    terms = ["agent", "agents", "gent", "session service", "she", "hers"]
+    matcher = TermMatcher(terms)
+
+    found = matcher.find("The Agents use a Session Service; ushers: she, agent_x")
+
+    assert {terms[i] for i in found} == {"agents", "session service", "she"}
+
+
+def test_render_and_check_per_language():
+    glossary = Glossary(
+        [
+            GlossaryEntry(term="Runner", keep=True),
+            GlossaryEntry(term="agent", translations={"es": "agente"}),
+        ]
+    )
+    entries = glossary.match("A Runner runs an agent.")
+
+    assert render_glossary(entries, "fr") == "GLOSARIO (obligatorio):\n- Runner → Runner (no traducir)"
+    assert check_glossary(entries, "es", "Un Runner ejecuta un agente.") == []
+    assert check_glossary(entries, "es", "Un ejecutor ejecuta un agente.") == ["Runner→Runner"]
@@ -0,0 +1,45 @@
+"""Tests de la etapa de I/O (write-behind con backpressure)."""
+
+import asyncio
+import threading
+import time
+
+from adk_traductor.io_stage import IOStage, LoopLag, LoopLagMonitor
+
+
+def test_write_behind_bounds_pending_writes_and_reports_errors():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    done: list[int] = []
+    failed: list[str] = []
+
+    def slow_write(i: int) -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        if i == 3:
+            raise OSError("disk full")
+
+    async def main() -> LoopLag:
+        lag = LoopLag()
+        with LoopLagMonitor(lag, interval=0.005):
+            async with IOStage(workers=8, max_pending=2) as io:
+                for i in range(10):
+                    await io.write_behind(
+                        slow_write, i, on_done=lambda i=i: done.append(i), on_error=lambda e: failed.append(str(e))
+                    )
+        return lag
+
+    lag = asyncio.run(main())
+
+    assert peak <= 2
+    assert sorted(done) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert failed == ["disk full"]
+    # Si las escrituras corrieran en el loop, cada una lo frenaría 10 ms (100 ms en total).
+    assert lag.samples > 0
+    assert lag.total < 0.05
@@ -0,0 +1,380 @@
+"""Tests del pipeline con un translator falso (no requiere API key)."""
+
+import asyncio
+import gc
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from adk_traductor import pipeline
+from adk_traductor.pipeline import TranslateOptions, prepare_markdown, translate_many
+
+
+class FakeTranslator:
+    def __init__(self, lang: str):
+        self.lang = lang
+        self.calls: list[str] = []
+        self.glossaries: list[str | None] = []
+
+    async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+        self.calls.append(text)
+        self.glossaries.append(glossary)
+        return f"[{self.lang}]{text}"
+
+
+@contextmanager
+def _crash_before_writing(monkeypatch, name: str):
+    """Simula un crash después de traducir `name` pero antes de escribir su salida."""
+    write_output = pipeline._write_output
+
+    def failing(path, *args, **kwargs):
+        if path.name == name:
+            raise OSError("crash")
+        write_output(path, *args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(pipeline, "_write_output", failing)
+        yield
+
+
+def _install_fake(monkeypatch) -> dict[str, FakeTranslator]:
+    created: dict[str, FakeTranslator] = {}
+
+    def factory(options, target_lang):
+        created[target_lang] = FakeTranslator(target_lang)
+        return created[target_lang]
+
+    monkeypatch.setattr(pipeline, "_create_translator", factory)
+    return created
+
+
+def test_prepare_markdown_protects_text_only():
+    md = "Use `a` and `b`.\n\n```python\nx = `c`\n```\n\nSee https://example.com\n"
+    doc = prepare_markdown(md)
+
+    assert "`a`" not in doc.payload
+    assert "https://example.com" not in doc.payload
+    assert "x = `c`" in doc.payload  # fences intactos
+    assert len(set(doc.mapping)) == 3  # sin colisiones entre segmentos
+
+
+def test_translate_many_fans_out_per_language(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    root = tmp_path / "docs"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.md").write_text("Hello `x`\n", encoding="utf-8")
+    (root / "sub" / "b.md").write_text("World\n", encoding="utf-8")
+    out = tmp_path / "out"
+
+    options = TranslateOptions(target_langs=("es", "pt"))
+    results = asyncio.run(
+        translate_many(sorted(root.rglob("*.md")), root=root, out_dir=out, options=options)
+    )
+
+    assert set(results.values()) == {"ok"}
+    assert len(results) == 4
+    assert (out / "es" / "a.md").read_text(encoding="utf-8") == "[es]Hello `x`\n"
+    assert (out / "pt" / "sub" / "b.md").read_text(encoding="utf-8") == "[pt]World\n"
+    # El payload enviado a cada idioma es el mismo documento protegido.
+    assert created["es"].calls == created["pt"].calls
+
+
+def test_translate_many_single_language_keeps_layout(tmp_path: Path, monkeypatch):
+    _install_fake(monkeypatch)
+    src = tmp_path / "a.md"
+    src.write_text("Hello\n", encoding="utf-8")
+
+    results = asyncio.run(
+        translate_many([src], root=tmp_path, out_dir=tmp_path / "out", options=TranslateOptions())
+    )
+
+    assert results == {str(src): "ok"}
+    assert (tmp_path / "out" / "a.md").exists()
+
+
+def test_resume_replays_journal_without_retranslating(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    root = tmp_path / "docs"
+    root.mkdir()
+    for name in ("a.md", "b.md"):
+        (root / name).write_text(f"{name}\n", encoding="utf-8")
+    out = tmp_path / "out"
+    inputs = sorted(root.glob("*.md"))
+
+    with _crash_before_writing(monkeypatch, "b.md"):
+        results = asyncio.run(translate_many(inputs, root=root, out_dir=out, options=TranslateOptions()))
+    assert results[str(root / "b.md")] == "error: crash"
+    assert len(created["es"].calls) == 2
+    assert not list(out.glob(".*.tmp"))  # escrituras atómicas sin restos
+    # Al terminar, el journal solo conserva el texto de lo que no llegó a escribirse.
+    journal = out / ".adk_journal.jsonl"
+    assert "[es]a.md" not in journal.read_text(encoding="utf-8")
+    assert "[es]b.md" in journal.read_text(encoding="utf-8")
+    with open(journal, "a", encoding="utf-8") as fh:
+        fh.write('{"out": "trunc')  # crash a mitad de un registro
+
+    # La misma corrida con --out-dir relativo: la clave no depende de cómo se escribió la ruta.
+    monkeypatch.chdir(tmp_path)
+    results = asyncio.run(
+        translate_many(inputs, root=root, out_dir=Path("out"), options=TranslateOptions(resume=True))
+    )
+
+    assert set(results.values()) == {"ok"}
+    assert created["es"].calls == []  # nada se vuelve a traducir
+    assert (out / "b.md").read_text(encoding="utf-8") == "[es]b.md\n"
+
+
+def test_translate_many_chunks_large_files(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    src = tmp_path / "big.md"
+    src.write_text("".join(f"Paragraph {i}.\n\n" for i in range(50)), encoding="utf-8")
+
+    options = TranslateOptions(max_chunk_tokens=20)
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=tmp_path / "out", options=options))
+
+    assert results == {str(src): "ok"}
+    calls = created["es"].calls
+    assert len(calls) > 1
+    out = (tmp_path / "out" / "big.md").read_text(encoding="utf-8")
+    assert out.count("[es]") == len(calls)
+    assert out.replace("[es]", "") == src.read_text(encoding="utf-8")
+
+
+def test_translate_many_attaches_only_matching_glossary_terms(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    glossary = tmp_path / "glossary.json"
+    glossary.write_text('{"Runner": null, "agent": {"es": "agente"}, "tool": "herramienta"}', encoding="utf-8")
+    src = tmp_path / "a.md"
+    src.write_text("The Runner drives the agent.\n", encoding="utf-8")
+
+    options = TranslateOptions(glossary=glossary)
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=tmp_path / "out", options=options))
+
+    (block,) = created["es"].glossaries
+    assert "Runner → Runner (no traducir)" in block
+    assert "agent → agente" in block
+    assert "tool" not in block
+    # El translator falso no traduce: "agente" falta en la salida.
+    assert results[str(src)] == "warning: glosario no respetado: agent→agente"
+
+
+def test_translate_many_fails_unit_when_placeholder_is_dropped(tmp_path: Path, monkeypatch):
+    class DroppingTranslator(FakeTranslator):
+        async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+            return text.replace("<<ADK_P1>>", "")
+
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: DroppingTranslator(lang))
+    src = tmp_path / "a.md"
+    src.write_text("Run `a` and then `b`.\n", encoding="utf-8")
+    out = tmp_path / "out"
+
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=out, options=TranslateOptions()))
+
+    assert results[str(src)] == "error: La traducción perdió placeholders: <<ADK_P1>>"
+    assert not (out / "a.md").exists()
+    # El chunk roto no queda en el journal: --resume lo vuelve a pedir.
+    assert "ADK_P0" not in (out / ".adk_journal.jsonl").read_text(encoding="utf-8")
+
+
+def test_translate_many_refuses_to_discard_previous_journal(tmp_path: Path, monkeypatch):
+    _install_fake(monkeypatch)
+    src = tmp_path / "a.md"
+    src.write_text("Hello\n", encoding="utf-8")
+    out = tmp_path / "out"
+    asyncio.run(translate_many([src], root=tmp_path, out_dir=out, options=TranslateOptions()))
+
+    # Después de una corrida completa, repetirla solo choca con las salidas existentes.
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=out, options=TranslateOptions()))
+    assert results == {str(src): f"error: Output exists: {out / 'a.md'}"}
+
+    (out / "a.md").unlink()
+    with _crash_before_writing(monkeypatch, "a.md"):
+        asyncio.run(translate_many([src], root=tmp_path, out_dir=out, options=TranslateOptions()))
+    journal = (out / ".adk_journal.jsonl").read_text(encoding="utf-8")
+
+    with pytest.raises(FileExistsError, match="--resume"):
+        asyncio.run(translate_many([src], root=tmp_path, out_dir=out, options=TranslateOptions()))
+    assert (out / ".adk_journal.jsonl").read_text(encoding="utf-8") == journal
+
+    results = asyncio.run(
+        translate_many([src], root=tmp_path, out_dir=out, options=TranslateOptions(overwrite=True))
+    )
+    assert results == {str(src): "ok"}
+
+
+def test_glossary_ignores_code_fences_and_frontmatter(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    glossary = tmp_path / "glossary.json"
+    glossary.write_text('{"agent": {"es": "agente"}}', encoding="utf-8")
+    src = tmp_path / "a.md"
+    src.write_text(
+        "---\ntitle: agent\n---\nCreate one.\n\n```python\nagent = Agent()\n```\n", encoding="utf-8"
+    )
+
+    options = TranslateOptions(glossary=glossary)
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=tmp_path / "out", options=options))
+
+    assert created["es"].glossaries == [None]
+    assert results == {str(src): "ok"}
+
+
+def test_glossary_check_does_not_count_terms_inside_fences(tmp_path: Path, monkeypatch):
+    class RenamingTranslator(FakeTranslator):
+        async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+            return text.replace("The Runner", "El ejecutor")
+
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: RenamingTranslator(lang))
+    glossary = tmp_path / "glossary.json"
+    glossary.write_text('{"Runner": null}', encoding="utf-8")
+    src = tmp_path / "a.md"
+    src.write_text("The Runner runs.\n\n```python\nr = Runner()\n```\n", encoding="utf-8")
+
+    options = TranslateOptions(glossary=glossary)
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=tmp_path / "out", options=options))
+
+    assert results[str(src)] == "warning: glosario no respetado: Runner→Runner"
+
+
+def test_resume_keeps_glossary_warnings_and_detects_glossary_changes(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    glossary = tmp_path / "glossary.json"
+    glossary.write_text('{"agent": {"es": "agente"}}', encoding="utf-8")
+    src = tmp_path / "a.md"
+    src.write_text("The agent runs.\n", encoding="utf-8")
+    out = tmp_path / "out"
+    journal = out / ".adk_journal.jsonl"
+    warning = {str(src): "warning: glosario no respetado: agent→agente"}
+
+    def run(**kwargs) -> dict[str, str]:
+        options = TranslateOptions(glossary=glossary, resume=True, **kwargs)
+        return asyncio.run(translate_many([src], root=tmp_path, out_dir=out, options=options))
+
+    with _crash_before_writing(monkeypatch, "a.md"):
+        assert run() == {str(src): "error: crash"}
+    # El chunk del journal se vuelve a verificar.
+    assert run() == warning
+    assert created["es"].calls == []
+    # Unidad terminada (journal ya compactado): el aviso se conserva sin volver a traducir.
+    assert "text" not in journal.read_text(encoding="utf-8")
+    assert run() == warning
+    assert created["es"].calls == []
+
+    # Otro glosario (o modelo) invalida lo traducido antes.
+    glossary.write_text('{"agent": {"es": "[es]The agent"}}', encoding="utf-8")
+    assert run(overwrite=True) == {str(src): "ok"}
+    assert created["es"].calls == ["The agent runs.\n"]
+
+
+def test_journal_append_failure_is_reported_per_file(tmp_path: Path, monkeypatch):
+    _install_fake(monkeypatch)
+
+    def record_chunk(self, unit, index, text):
+        if unit.out.endswith("b.md"):
+            raise OSError("disk full")
+
+    monkeypatch.setattr(pipeline.Journal, "record_chunk", record_chunk)
+    root = tmp_path / "docs"
+    root.mkdir()
+    for name in ("a.md", "b.md"):
+        (root / name).write_text(f"{name}\n", encoding="utf-8")
+    inputs = sorted(root.glob("*.md"))
+
+    results = asyncio.run(translate_many(inputs, root=root, out_dir=tmp_path / "out", options=TranslateOptions()))
+
+    assert results == {str(root / "a.md"): "ok", str(root / "b.md"): "error: disk full"}
+
+    with pytest.raises(OSError):
+        asyncio.run(
+            translate_many(
+                inputs,
+                root=root,
+                out_dir=tmp_path / "out2",
+                options=TranslateOptions(),
+                continue_on_error=False,
+            )
+        )
+
+
+def test_fail_fast_drains_queued_writes_before_closing_journal(tmp_path: Path, monkeypatch):
+    created = _install_fake(monkeypatch)
+    root = tmp_path / "docs"
+    root.mkdir()
+    for name in ("a.md", "b.md"):
+        (root / name).write_text(f"{name}\n", encoding="utf-8")
+    out = tmp_path / "out"
+    with _crash_before_writing(monkeypatch, "a.md"):
+        asyncio.run(translate_many([root / "a.md"], root=root, out_dir=out, options=TranslateOptions()))
+    # b.md ya existe y no es nuestro.
+    journal = out / ".adk_journal.jsonl"
+    (out / "b.md").write_text("mine\n", encoding="utf-8")
+
+    write_output = pipeline._write_output
+
+    def slow_write(*args, **kwargs):
+        time.sleep(0.1)  # el commit de a.md sigue en el pool cuando b.md falla
+        write_output(*args, **kwargs)
+
+    monkeypatch.setattr(pipeline, "_write_output", slow_write)
+    options = TranslateOptions(resume=True)
+    with pytest.raises(FileExistsError):
+        asyncio.run(
+            translate_many(sorted(root.glob("*.md")), root=root, out_dir=out, options=options, continue_on_error=False)
+        )
+
+    assert created["es"].calls == []
+    assert (out / "a.md").read_text(encoding="utf-8") == "[es]a.md\n"
+    assert '"done": true' in journal.read_text(encoding="utf-8")
+
+
+def test_glossary_check_keeps_prose_after_a_thematic_break_chunk(tmp_path: Path, monkeypatch):
+    class GlossaryTranslator(FakeTranslator):
+        async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+            return text.replace("agent", "agente")
+
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: GlossaryTranslator(lang))
+    glossary = tmp_path / "glossary.json"
+    glossary.write_text('{"agent": {"es": "agente"}}', encoding="utf-8")
+    src = tmp_path / "a.md"
+    src.write_text("Intro paragraph. " * 12 + "\n\n---\n\nThe agent runs.\n", encoding="utf-8")
+
+    options = TranslateOptions(glossary=glossary, max_chunk_tokens=50)
+    results = asyncio.run(translate_many([src], root=tmp_path, out_dir=tmp_path / "out", options=options))
+
+    # El segundo chunk empieza con `---`: es una línea horizontal, no frontmatter.
+    assert results == {str(src): "ok"}
+
+
+def test_translate_many_releases_finished_documents(tmp_path: Path, monkeypatch):
+    docs: list[weakref.ref] = []
+    prepare = pipeline.prepare_markdown
+
+    def tracking_prepare(md: str):
+        doc = prepare(md)
+        docs.append(weakref.ref(doc))
+        return doc
+
+    alive_at_last_call: list[bool] = []
+
+    class CheckingTranslator(FakeTranslator):
+        async def translate_text(self, text: str, *, glossary: str | None = None) -> str:
+            if text.startswith("c.md"):
+                await asyncio.sleep(0.1)  # deja terminar los commits de a.md y b.md
+                gc.collect()
+                alive_at_last_call.extend(ref() is not None for ref in docs[:2])
+            return await super().translate_text(text, glossary=glossary)
+
+    monkeypatch.setattr(pipeline, "prepare_markdown", tracking_prepare)
+    monkeypatch.setattr(pipeline, "_create_translator", lambda options, lang: CheckingTranslator(lang))
+    root = tmp_path / "docs"
+    root.mkdir()
+    for name in ("a.md", "b.md", "c.md"):
+        (root / name).write_text(f"{name}\n", encoding="utf-8")
+
+    options = TranslateOptions(jobs=1)
+    results = asyncio.run(translate_many(sorted(root.glob("*.md")), root=root, out_dir=tmp_path / "out", options=options))
+
+    assert set(results.values()) == {"ok"}
+    assert alive_at_last_call == [False, False]
@@ -0,0 +1,32 @@
+"""Tests del planner: chunking y proyección LPT."""
+
+from adk_traductor.pipeline import prepare_markdown
+from adk_traductor.planner import chunk_document, estimate_tokens, projected_seconds, request_seconds
+
+
+def test_chunk_document_splits_outliers_at_paragraphs():
+    md = "".join(f"Paragraph {i} " + "word " * 40 + "\n\n" for i in range(20))
+    md += "```python\n# comment\nx = 1\n```\n"
+    doc = prepare_markdown(md)
+
+    chunks = chunk_document(doc, max_tokens=200)
+
+    assert len(chunks) > 1
+    assert "".join(c.text for c in chunks) == doc.payload
+    assert all(c.text.endswith("\n") for c in chunks)
+    assert chunks[-1].text.endswith("```\n")  # el fence nunca se parte
+
+
+def test_chunk_document_small_file_is_single_chunk():
+    doc = prepare_markdown("# Title\n\n```python\nprint('x' * 10000)\n```\n")
+
+    chunks = chunk_document(doc)
+
+    assert len(chunks) == 1
+    assert chunks[0].tokens == estimate_tokens("# Title\n\n")  # fences no cuentan
+
+
+def test_projected_seconds_is_lpt_makespan():
+    # Con 2 workers, LPT pone el grande solo y los dos chicos juntos.
+    assert projected_seconds([1200, 300, 300], jobs=2) == request_seconds(1200)
+    assert projected_seconds([100, 100], jobs=1) == 2 * request_seconds(100)